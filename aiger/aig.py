@@ -8,9 +8,11 @@ from abc import ABCMeta, abstractmethod
 import operator as op
 import pathlib
 from typing import Tuple, FrozenSet
+from weakref import WeakValueDictionary
 
 import attr
 import funcy as fn
+import pyrsistent
 from pyrsistent import pmap
 from pyrsistent.typing import PMap
 
@@ -23,26 +25,31 @@ from aiger import writer
 @attr.s(frozen=True, auto_attribs=True, eq=False)
 class Node(metaclass=ABCMeta):
     def __and__(self, other: Node) -> Node:
-        if self.is_false or other.is_false:
-            return ConstFalse()
+        if self.is_false:
+            return self
+        elif other.is_false:
+            return other
         elif self.is_true:
             return other
         elif other.is_true:
             return self
-        return AndGate(self, other)
+        return _and_gate(self, other)
 
     def __invert__(self) -> Node:
-        if isinstance(self, Inverter):
+        if type(self) is Inverter:
             return self.input
-        return Inverter(self)
+        return _inverter(self)
 
     @property
     def is_false(self):
-        return isinstance(self, ConstFalse)
+        # Exact type checks (here and in is_true): isinstance through
+        # ABCMeta is comparatively slow and these sit on the hot path of
+        # every & during flattening.
+        return type(self) is ConstFalse
 
     @property
     def is_true(self):
-        return (~self).is_false
+        return type(self) is Inverter and type(self.input) is ConstFalse
 
     @property
     @abstractmethod
@@ -60,7 +67,7 @@ class AndGate(Node):
         return (self.left, self.right)
 
 
-@attr.s(frozen=True, auto_attribs=True)  # Allow Hashing.
+@attr.s(frozen=True, auto_attribs=True, cache_hash=True)  # Allow Hashing.
 class Inverter(Node):
     input: Node
 
@@ -69,7 +76,7 @@ class Inverter(Node):
         return (self.input, )
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, cache_hash=True)
 class Input(Node):
     name: str
 
@@ -78,7 +85,7 @@ class Input(Node):
         return ()
 
 
-@attr.s(frozen=True, auto_attribs=True)
+@attr.s(frozen=True, auto_attribs=True, cache_hash=True)
 class LatchIn(Node):
     name: str
 
@@ -97,12 +104,70 @@ class ConstFalse(Node):
         return hash(False)
 
 
+_NODE_KINDS = frozenset({AndGate, Inverter, Input, LatchIn, ConstFalse})
+
+
+def _node_kind(node: Node) -> type:
+    """Slow path of AIG evaluation's dispatch, e.g., for subclasses."""
+    for kind in _NODE_KINDS:
+        if isinstance(node, kind):
+            return kind
+    raise TypeError(f"Unsupported node type: {type(node).__name__}")
+
+
+# Hash-consing tables used by Node.__and__ and Node.__invert__.
+# Keyed on the ids of the children. A cached node keeps its children
+# alive, so their ids cannot be reused while the entry exists.
+_AND_CACHE = WeakValueDictionary()
+_INV_CACHE = WeakValueDictionary()
+
+
+def _and_gate(left: Node, right: Node) -> AndGate:
+    key = (id(left), id(right))
+    node = _AND_CACHE.get(key)
+    if node is None:
+        node = _AND_CACHE[key] = AndGate(left, right)
+    return node
+
+
+def _inverter(node: Node) -> Inverter:
+    key = id(node)
+    inv = _INV_CACHE.get(key)
+    if inv is None:
+        inv = _INV_CACHE[key] = Inverter(node)
+    return inv
+
+
+# Interning tables for leaf nodes, keyed on name.
+_INPUT_CACHE = WeakValueDictionary()
+_LATCHIN_CACHE = WeakValueDictionary()
+
+
+def _input(name: str) -> Input:
+    node = _INPUT_CACHE.get(name)
+    if node is None:
+        node = _INPUT_CACHE[name] = Input(name)
+    return node
+
+
+def _latchin(name: str) -> LatchIn:
+    node = _LATCHIN_CACHE.get(name)
+    if node is None:
+        node = _LATCHIN_CACHE[name] = LatchIn(name)
+    return node
+
+
+def _to_pmap(mapping) -> PMap:
+    # Avoid rehashing every key and node when handed a PMap already.
+    return mapping if isinstance(mapping, pyrsistent.PMap) else pmap(mapping)
+
+
 @attr.s(frozen=True, auto_attribs=True, repr=False)
 class AIG:
     inputs: FrozenSet[str] = frozenset()
-    node_map: PMap[str, Node] = attr.ib(default=pmap(), converter=pmap)
-    latch_map: PMap[str, Node] = attr.ib(default=pmap(), converter=pmap)
-    latch2init: PMap[str, bool] = attr.ib(default=pmap(), converter=pmap)
+    node_map: PMap[str, Node] = attr.ib(default=pmap(), converter=_to_pmap)
+    latch_map: PMap[str, Node] = attr.ib(default=pmap(), converter=_to_pmap)
+    latch2init: PMap[str, bool] = attr.ib(default=pmap(), converter=_to_pmap)
     comments: Tuple[str] = ()
 
     def __repr__(self):
@@ -121,7 +186,12 @@ class AIG:
         dependencies. Namely, to compute the value of any node
         requires just the value of the nodes in the previous iterator.
         """
-        return [cmn.dfs(self)]
+        return [self._dfs_order]
+
+    @fn.cached_property
+    def _dfs_order(self):
+        # Forced once and replayed on every evaluation / simulation step.
+        return tuple(cmn.dfs(self))
 
     def evolve(self, **kwargs):
         return attr.evolve(self, **kwargs)
@@ -138,22 +208,27 @@ class AIG:
     def lazy_aig(self):
         return A.lazy(self)
 
-    @property
+    @fn.cached_property
     def outputs(self):
         return frozenset(self.node_map.keys())
 
-    @property
+    @fn.cached_property
     def latches(self):
         return frozenset(self.latch2init.keys())
 
-    @property
+    @fn.cached_property
     def cones(self):
         return frozenset(self.node_map.values())
 
-    @property
+    @fn.cached_property
     def latch_cones(self):
         return frozenset(self.latch_map.values())
 
+    @fn.cached_property
+    def _boundary(self):
+        # Nodes whose values are reported as outputs or latch outputs.
+        return self.cones | self.latch_cones
+
     def __rshift__(self, other):
         return seq_compose(self, other)
 
@@ -181,12 +256,10 @@ class AIG:
         else:
             and_, neg = op.__and__, op.__invert__
 
-        latchins = fn.merge(dict(self.latch2init), latches)
-        # Remove latch inputs not used by self.
-        latchins = fn.project(latchins, self.latches)
+        # Override initial values. Latch inputs not used by self are dropped.
+        latchins = {k: latches.get(k, v) for k, v in self.latch2init.items()}
 
-        latch_map = dict(self.latch_map)
-        boundary = set(self.node_map.values()) | set(latch_map.values())
+        boundary = self._boundary
 
         store, prev, mem = {}, set(), {}
         for node_batch in self.__iter_nodes__():
@@ -194,22 +267,28 @@ class AIG:
             mem = fn.project(mem, prev)  # Forget about unnecessary gates.
 
             for gate in node_batch:
-                if isinstance(gate, Inverter):
-                    mem[gate] = neg(mem[gate.input])
-                elif isinstance(gate, AndGate):
-                    mem[gate] = and_(mem[gate.left], mem[gate.right])
-                elif isinstance(gate, Input):
-                    mem[gate] = lift(inputs[gate.name])
-                elif isinstance(gate, LatchIn):
-                    mem[gate] = lift(latchins[gate.name])
-                elif isinstance(gate, ConstFalse):
-                    mem[gate] = lift(False)
+                # Dispatch on exact type, most common gates first.
+                kind = type(gate)
+                if kind not in _NODE_KINDS:
+                    kind = _node_kind(gate)
+
+                if kind is AndGate:
+                    val = and_(mem[gate.left], mem[gate.right])
+                elif kind is Inverter:
+                    val = neg(mem[gate.input])
+                elif kind is Input:
+                    val = lift(inputs[gate.name])
+                elif kind is LatchIn:
+                    val = lift(latchins[gate.name])
+                else:  # ConstFalse
+                    val = lift(False)
+                mem[gate] = val
 
                 if gate in boundary:
-                    store[gate] = mem[gate]  # Store for eventual output.
+                    store[gate] = val  # Store for eventual output.
 
         outs = {out: store[gate] for out, gate in self.node_map.items()}
-        louts = {out: store[gate] for out, gate in latch_map.items()}
+        louts = {out: store[gate] for out, gate in self.latch_map.items()}
         return outs, louts
 
     def simulator(self, latches=None):
@@ -1,6 +1,49 @@
+from itertools import count
+
 import hypothesis.strategies as st
 
-from aiger_ptltl.test_ptltl import PTLTL_STRATEGY
+from aiger import common as cmn
+
+
+ATOMS = 'abcdefghijkl'
+_COUNTER = count()
+
+
+def _fresh():
+    # Cheaper than uuid based names. Only needs to be unique per process.
+    return f'l{next(_COUNTER)}'
+
+
+def atomic_pred(name):
+    return cmn.identity([name], [_fresh()])
+
+
+def combine_and(left, right):
+    combined = left | right
+    return combined >> cmn.and_gate(combined.outputs, _fresh())
+
+
+def negate(circ):
+    return circ >> cmn.bit_flipper(circ.outputs)
+
+
+def delay(circ, init):
+    return circ >> cmn.delay(
+        inputs=list(circ.outputs),
+        initials=[init],
+        latches=[_fresh()],
+        outputs=[_fresh()],
+    )
+
+
+def _extend(circuits):
+    return st.one_of(
+        st.tuples(circuits, circuits).map(lambda lr: combine_and(*lr)),
+        circuits.map(negate),
+        st.tuples(circuits, st.booleans()).map(lambda cb: delay(*cb)),
+    )
 
 
-Circuits = st.builds(lambda expr: expr.aig, PTLTL_STRATEGY)
+Circuits = st.recursive(
+    st.sampled_from(ATOMS).map(atomic_pred), _extend, max_leaves=8
+)
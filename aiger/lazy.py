@@ -15,7 +15,7 @@ from pyrsistent import pmap
 from pyrsistent.typing import PMap
 
 import aiger as A
-from aiger.aig import AIG, Node, Input, LatchIn
+from aiger.aig import AIG, Node, _input, _latchin, _to_pmap
 from aiger.aig import ConstFalse
 
 
@@ -25,7 +25,8 @@ class LazyAIG:
         pass
 
     @property
-    def latch2init(self):
+    def latch2init(self) -> PMap[str, bool]:
+        """Initial latch values. Always an (immutable) PMap."""
         pass
 
     @property
@@ -47,7 +48,7 @@ class LazyAIG:
     simulator = AIG.simulator
     simulate = AIG.simulate
 
-    @property
+    @fn.cached_property
     def latches(self) -> FrozenSet[str]:
         return frozenset(self.latch2init.keys())
 
@@ -55,20 +56,17 @@ class LazyAIG:
     def lazy_aig(self) -> LazyAIG:
         return self
 
-    @property
+    @fn.cached_property
     def aig(self) -> AIG:
-        """Return's flattened AIG represented by this LazyAIG."""
-        false = ConstFalse()
-        inputs = {i: Input(i) for i in self.inputs}
-        latches = {i: LatchIn(i) for i in self.latches}
-
-        def lift(obj):
-            if isinstance(obj, Node):
-                return obj
-            assert isinstance(obj, bool)
-            return ~false if obj else false
-
-        node_map, latch_map = self(inputs, latches=latches, lift=lift)
+        """Return's flattened AIG represented by this LazyAIG.
+
+        The result is cached on the instance, which is safe since
+        LazyAIGs are immutable.
+        """
+        inputs = {i: _input(i) for i in self.inputs}
+        latches = {i: _latchin(i) for i in self.latches}
+
+        node_map, latch_map = self(inputs, latches=latches, lift=_lift_node)
         return AIG(
             comments=self.comments,
             inputs=self.inputs,
@@ -100,7 +98,7 @@ class LazyAIG:
            determines how to rename latches to avoid name collisions.
         """
         lcirc = CutLatches(self, renamer=renamer, cut=latches)
-        l2init = dict(self.latch2init)
+        l2init = self.latch2init
         lmap = {k: (lcirc.renamer(k), l2init[k]) for k in lcirc.cut}
         return lcirc, lmap
 
@@ -154,28 +152,46 @@ class LazyAIG:
             'o': 'output_relabels',
         }.get(kind)
 
+        if isinstance(self, Relabeled) and not getattr(self, key):
+            # Fuse into the existing relabeling rather than nesting.
+            return attr.evolve(self, **{key: relabels})
         return A.Relabeled(self, **{key: relabels})
 
     def reinit(self, latch2init) -> LazyAIG:
         """Update late initial values based on mapping provided."""
         assert set(latch2init.keys()) <= self.latches
+        if isinstance(self, UpdatedLatchInits):
+            # Fuse consecutive reinits into a single update.
+            latch2init = pmap(self._latch2init).update(latch2init)
+            return UpdatedLatchInits(circ=self.circ, latch2init=latch2init)
         return UpdatedLatchInits(circ=self, latch2init=latch2init)
 
 
 AIG_Like = Union[AIG, LazyAIG]
 Labels = Mapping[str, str]
 
+_FALSE = ConstFalse()
+_TRUE = ~_FALSE
+
+
+def _lift_node(obj):
+    """Interpret constants as (shared) nodes while flattening."""
+    if isinstance(obj, bool):
+        return _TRUE if obj else _FALSE
+    assert isinstance(obj, Node)
+    return obj
+
 
 def walk_keys(func, mapping):
-    return fn.walk_keys(func, dict(mapping))
+    return {func(k): v for k, v in mapping.items()}
 
 
 def omit(mapping, keys):
-    return fn.omit(dict(mapping), keys)
+    return {k: v for k, v in mapping.items() if k not in keys}
 
 
 def project(mapping, keys):
-    return fn.project(dict(mapping), keys)
+    return {k: mapping[k] for k in keys if k in mapping}
 
 
 @attr.s(frozen=True, auto_attribs=True)
@@ -186,21 +202,21 @@ class Parallel(LazyAIG):
     def __call__(self, inputs, latches=None, *, lift=None):
         out_l, lmap_l = self.left(inputs, latches=latches, lift=lift)
         out_r, lmap_r = self.right(inputs, latches=latches, lift=lift)
-        return fn.merge(out_l, out_r), fn.merge(lmap_l, lmap_r)
+        return {**out_l, **out_r}, {**lmap_l, **lmap_r}
 
     def _merge_maps(self, key):
-        map1, map2 = [pmap(getattr(c, key)) for c in (self.left, self.right)]
-        return map1 + map2
+        map1, map2 = [getattr(c, key) for c in (self.left, self.right)]
+        return _to_pmap(map1).update(map2)
 
-    @property
+    @fn.cached_property
     def latch2init(self):
         return self._merge_maps('latch2init')
 
-    @property
+    @fn.cached_property
     def inputs(self):
         return self.left.inputs | self.right.inputs
 
-    @property
+    @fn.cached_property
     def outputs(self):
         return self.left.outputs | self.right.outputs
 
@@ -231,9 +247,10 @@ class LoopBack(LazyAIG):
     wirings: Sequence[Wire] = attr.ib(converter=convert_wirings)
 
     def __call__(self, inputs, latches=None, *, lift=None):
+        inputs = dict(inputs)
         if latches is None:
             latches = pmap()
-        latches = dict(self.latch2init + latches)  # Override initial values.
+        latches = {**self.latch2init, **latches}  # Override initial values.
 
         for wire in self.wirings:
             inputs[wire.input] = latches[wire.latch]
@@ -249,18 +266,16 @@ class LoopBack(LazyAIG):
 
         return omap, lmap
 
-    @property
+    @fn.cached_property
     def latch2init(self):
-        latch2init = pmap(self.circ.latch2init).evolver()
-        for wire in self.wirings:
-            latch2init[wire.latch] = wire.init
-        return latch2init.persistent()
+        inits = {wire.latch: wire.init for wire in self.wirings}
+        return _to_pmap(self.circ.latch2init).update(inits)
 
-    @property
+    @fn.cached_property
     def inputs(self):
         return self.circ.inputs - {w.input for w in self.wirings}
 
-    @property
+    @fn.cached_property
     def outputs(self):
         omitted = {w.output for w in self.wirings if not w.keep_output}
         return self.circ.outputs - omitted
@@ -291,7 +306,7 @@ class CutLatches(LazyAIG):
         inputs = dict(inputs)
         if latches is None:
             latches = pmap()
-        latches = dict(self.latch2init + latches)  # Override initial values.
+        latches = {**self.latch2init, **latches}  # Override initial values.
 
         for latch in self.cut:
             new_name = self.renamer(latch)
@@ -307,15 +322,15 @@ class CutLatches(LazyAIG):
 
         return omap, lmap
 
-    @property
+    @fn.cached_property
     def latch2init(self):
         return pmap(omit(self.circ.latch2init, self.cut))
 
-    @property
+    @fn.cached_property
     def inputs(self):
         return self.circ.inputs | set(map(self.renamer, self.cut))
 
-    @property
+    @fn.cached_property
     def outputs(self):
         return self.circ.outputs | set(map(self.renamer, self.cut))
 
@@ -338,25 +353,25 @@ class Cascading(LazyAIG):
         omap_l = omit(omap_l, self._interface)
 
         omap_r, lmap_r = self.right(inputs_r, latches=latches, lift=lift)
-        return fn.merge(omap_l, omap_r), fn.merge(lmap_l, lmap_r)
+        return {**omap_l, **omap_r}, {**lmap_l, **lmap_r}
 
     def _merge_maps(self, key):
-        map1, map2 = [pmap(getattr(c, key)) for c in (self.left, self.right)]
-        return map1 + map2
+        map1, map2 = [getattr(c, key) for c in (self.left, self.right)]
+        return _to_pmap(map1).update(map2)
 
-    @property
+    @fn.cached_property
     def latch2init(self):
         return self._merge_maps('latch2init')
 
-    @property
+    @fn.cached_property
     def _interface(self):
         return self.left.outputs & self.right.inputs
 
-    @property
+    @fn.cached_property
     def inputs(self):
         return self.left.inputs | (self.right.inputs - self._interface)
 
-    @property
+    @fn.cached_property
     def outputs(self):
         return self.right.outputs | (self.left.outputs - self._interface)
 
@@ -366,7 +381,7 @@ class Cascading(LazyAIG):
 
 
 def _relabel_map(relabels, mapping):
-    return pmap(walk_keys(lambda x: relabels.get(x, x), mapping))
+    return walk_keys(lambda x: relabels.get(x, x), mapping)
 
 
 @attr.s(frozen=True, auto_attribs=True)
@@ -378,18 +393,18 @@ class UpdatedLatchInits(LazyAIG):
         if latches is None:
             latches = pmap()
 
-        latches = dict(self.latch2init + latches)  # Override initial values.
+        latches = {**self.latch2init, **latches}  # Override initial values.
         return self.circ(inputs, latches=latches, lift=lift)
 
-    @property
+    @fn.cached_property
     def latch2init(self):
-        return self.circ.latch2init + self._latch2init
+        return _to_pmap(self.circ.latch2init).update(self._latch2init)
 
-    @property
+    @fn.cached_property
     def inputs(self):
         return self.circ.inputs
 
-    @property
+    @fn.cached_property
     def outputs(self):
         return self.circ.outputs
 
@@ -409,29 +424,42 @@ class Relabeled(LazyAIG):
         if latches is None:
             latches = pmap()
 
-        latches = dict(self.latch2init + latches)  # Override initial values.
+        latches = {**self.latch2init, **latches}  # Override initial values.
 
-        new2old_i = bidict(self.input_relabels).inv
-        new2old_l = bidict(self.latch_relabels).inv
-        inputs = _relabel_map(new2old_i, inputs)
-        latches = _relabel_map(new2old_l, latches)
+        # Only walk the maps whose names actually change.
+        if self.input_relabels:
+            inputs = _relabel_map(self._new2old_inputs, inputs)
+        if self.latch_relabels:
+            latches = _relabel_map(self._new2old_latches, latches)
 
         omap, lmap = self.circ(inputs, latches=latches, lift=lift)
 
-        omap = _relabel_map(self.output_relabels, omap)
-        lmap = _relabel_map(self.latch_relabels, lmap)
-        return dict(omap), dict(lmap)
+        if self.output_relabels:
+            omap = _relabel_map(self.output_relabels, omap)
+        if self.latch_relabels:
+            lmap = _relabel_map(self.latch_relabels, lmap)
+        return omap, lmap
 
-    @property
+    @fn.cached_property
+    def _new2old_inputs(self):
+        return bidict(self.input_relabels).inv
+
+    @fn.cached_property
+    def _new2old_latches(self):
+        return bidict(self.latch_relabels).inv
+
+    @fn.cached_property
     def latch2init(self):
-        return _relabel_map(self.latch_relabels, self.circ.latch2init)
+        if not self.latch_relabels:
+            return _to_pmap(self.circ.latch2init)
+        return pmap(_relabel_map(self.latch_relabels, self.circ.latch2init))
 
-    @property
+    @fn.cached_property
     def inputs(self):
         old_inputs = self.circ.inputs
         return frozenset(self.input_relabels.get(i, i) for i in old_inputs)
 
-    @property
+    @fn.cached_property
     def outputs(self):
         old_outputs = self.circ.outputs
         return frozenset(self.output_relabels.get(i, i) for i in old_outputs)
@@ -480,27 +508,22 @@ class Unrolled(LazyAIG):
 
         assert set(outputs.keys()) == self.outputs
 
-        return dict(outputs), {}
+        return outputs, {}
 
     @property
     def latch2init(self):
         return pmap()
 
-    def __with_times(self, keys, times):
-        for time in times:
-            template = '{}' + f'##time_{time}'
-            yield from map(template.format, keys)
-
     def _with_times(self, keys, times):
-        return frozenset(self.__with_times(keys, times))
+        return frozenset(f'{k}##time_{t}' for t in times for k in keys)
 
-    @property
+    @fn.cached_property
     def inputs(self):
         base = set() if self.init else self.circ.latches
         base |= self.circ.inputs
         return self._with_times(base, times=range(self.horizon))
 
-    @property
+    @fn.cached_property
     def outputs(self):
         start = self.horizon if self.only_last_outputs else 1
         base = set() if self.omit_latches else self.circ.latches
@@ -521,13 +544,13 @@ class Lifted(LazyAIG):
 
     @property
     def latch2init(self):
-        return self.circ.latch2init
+        return _to_pmap(self.circ.latch2init)
 
-    @property
+    @fn.cached_property
     def inputs(self):
         return self.circ.inputs
 
-    @property
+    @fn.cached_property
     def outputs(self):
         return self.circ.outputs
 
@@ -538,6 +561,8 @@ class Lifted(LazyAIG):
 
 def lazy(circ: Union[AIG, LazyAIG]) -> LazyAIG:
     """Lifts AIG to a LazyAIG."""
+    if isinstance(circ, LazyAIG):
+        return circ
     return Lifted(circ)
 
 
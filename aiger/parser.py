@@ -184,6 +184,7 @@ def parse_and(state, line) -> bool:
 
 
 SYM_PATTERN = re.compile(r"([ilo])(\d+) (.*)\n")
+SYM_TABLES = {'i': 'inputs', 'o': 'outputs', 'l': 'latches'}
 
 
 def parse_symbol(state, line) -> bool:
@@ -193,11 +194,7 @@ def parse_symbol(state, line) -> bool:
 
     kind, idx, name = match.groups()
 
-    table = {
-        'i': state.symbols.inputs,
-        'o': state.symbols.outputs,
-        'l': state.symbols.latches
-    }.get(kind)
+    table = getattr(state.symbols, SYM_TABLES[kind])
     table[int(idx)] = name
     return True
 
@@ -1,6 +1,11 @@
+import gc
 import pathlib
 import tempfile
 
+import attr
+import pyrsistent
+import pytest
+
 import aiger
 
 
@@ -20,3 +25,104 @@ def test_to_aig():
         assert isinstance(c2, aiger.AIG)
         assert isinstance(c3, aiger.AIG)
         assert isinstance(c4, aiger.AIG)
+
+
+def test_node_hash_consing():
+    x, y = aiger.aig.Input('x'), aiger.aig.Input('y')
+    assert (x & y) is (x & y)
+    assert ~(x & y) is ~(x & y)
+
+    # Entries do not outlive their nodes.
+    key = (id(x), id(y))
+    gate = x & y
+    assert aiger.aig._AND_CACHE[key] is gate
+    del gate
+    gc.collect()
+    assert key not in aiger.aig._AND_CACHE
+
+
+def test_lazy_aig_cached():
+    circ = aiger.and_gate(['x', 'y'], 'out').lazy_aig
+    circ >>= aiger.bit_flipper(['out'])
+    assert circ.aig is circ.aig
+
+
+def test_lazy_fuses_relabels_and_reinits():
+    circ = aiger.delay(['x'], [True], outputs=['y']).lazy_aig
+    relabeled = circ['i', {'x': 'z'}]['o', {'y': 'w'}]
+    assert relabeled.circ is circ
+    assert relabeled.inputs == {'z'}
+    assert relabeled.outputs == {'w'}
+
+    reinited = circ.reinit({'x': False}).reinit({'x': True})
+    assert reinited.circ is circ
+    assert reinited.latch2init == {'x': True}
+    assert isinstance(reinited._latch2init, pyrsistent.PMap)
+
+
+def test_lazy_idempotent():
+    circ = aiger.lazy(aiger.and_gate(['x', 'y'], 'out'))
+    assert aiger.lazy(circ) is circ
+
+
+def test_lazy_merged_latch2init_read_only():
+    circ = aiger.delay(['x'], [True]).lazy_aig
+    for lcirc in [circ >> aiger.identity(['x'], ['y']),
+                  circ | aiger.delay(['y'], [False]),
+                  circ.reinit({'x': False})]:
+        with pytest.raises(TypeError):
+            lcirc.latch2init['zzz'] = False
+        assert 'zzz' not in lcirc.aig.latches
+
+
+def test_lazy_latch2init_is_pmap():
+    circ = aiger.delay(['x'], [True], outputs=['y']).lazy_aig
+    other = aiger.delay(['z'], [False])
+    wire = {'input': 'x', 'output': 'y', 'latch': 'w', 'init': False}
+    lcircs = [
+        aiger.lazy(other.aig),
+        circ | other,
+        circ >> aiger.identity(['y'], ['y2']),
+        circ.reinit({'x': False}),
+        circ.loopback(wire),
+        circ.cutlatches()[0],
+        circ['l', {'x': 'x2'}],
+        circ['o', {'y': 'y2'}],
+        circ.unroll(2),
+    ]
+    for lcirc in lcircs:
+        latch2init = lcirc.latch2init
+        assert isinstance(latch2init, pyrsistent.PMap)
+        assert latch2init == lcirc.aig.latch2init
+        with pytest.raises(TypeError):
+            latch2init['zzz'] = False
+
+
+def test_eval_rejects_unknown_nodes():
+    @attr.s(frozen=True, auto_attribs=True)
+    class Weird(aiger.aig.Node):
+        @property
+        def children(self):
+            return ()
+
+    @attr.s(frozen=True, auto_attribs=True, cache_hash=True)
+    class NamedInput(aiger.aig.Input):
+        pass
+
+    circ = aiger.AIG(inputs={'x'}, node_map={'o': ~NamedInput('x')})
+    assert circ({'x': True})[0] == {'o': False}
+
+    with pytest.raises(TypeError):
+        aiger.AIG(node_map={'o': Weird()})({})
+
+
+def test_lazy_loopback_does_not_leak_into_siblings():
+    circ = aiger.and_gate(['a', 'b'], 'o').lazy_aig.loopback({
+        'input': 'b', 'output': 'o', 'latch': 'L', 'init': True
+    })
+    par = circ['o', {'o': 'o2'}] | aiger.identity(['b'], ['ob'])
+
+    inputs = {'a': True, 'b': False}
+    omap, _ = par.aig(inputs)
+    assert omap == {'o2': True, 'ob': False}
+    assert inputs == {'a': True, 'b': False}